@@ -0,0 +1,81 @@
+# cython: language_level=3
+"""
+_rise_kernel.pyx
+
+Optional compiled versions of the bread_rise_time.py model kernels.
+bread_rise_time.py imports this module when it has been built and otherwise uses
+its pure-Python _bulk_hours_kernel / _dry_equiv_kernel (the reference implementation).
+
+Build in place (requires Cython and a C compiler):
+  cythonize -i _rise_kernel.pyx
+
+Keep both functions in sync with the Python kernels in bread_rise_time.py, edge cases included:
+there is no cdivision (x / 0.0 raises ZeroDivisionError), NaN clips to 0.15 like
+min(72.0, max(0.15, nan)), and wherever libc pow() leaves the finite range -- where Python's **
+would raise or go complex instead -- the result is recomputed with Python semantics.
+"""
+
+from libc.math cimport isfinite, pow
+
+
+cdef object _bulk_hours_py(flour_g, dry_yeast_equiv_g, room_temp_c, baseline_ratio,
+                           baseline_time_h, baseline_temp_c, yeast_exponent, q10):
+    # Untyped on purpose: Python float arithmetic, exactly as in _bulk_hours_kernel.
+    ratio = dry_yeast_equiv_g / flour_g
+    yeast_factor = (baseline_ratio / ratio) ** yeast_exponent
+    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
+    est_h = baseline_time_h * yeast_factor * temp_factor
+    return min(72.0, max(0.15, est_h))
+
+
+cdef object _dry_equiv_py(flour_g, desired_time_h, room_temp_c, baseline_ratio,
+                          baseline_time_h, baseline_temp_c, yeast_exponent, q10):
+    # Untyped on purpose: Python float arithmetic, exactly as in _dry_equiv_kernel.
+    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
+    ratio = baseline_ratio * (baseline_time_h * temp_factor / desired_time_h) ** (1.0 / yeast_exponent)
+    return ratio * flour_g
+
+
+cpdef double bulk_hours(
+    double flour_g,
+    double dry_yeast_equiv_g,
+    double room_temp_c,
+    double baseline_ratio,
+    double baseline_time_h,
+    double baseline_temp_c,
+    double yeast_exponent,
+    double q10,
+):
+    cdef double ratio = dry_yeast_equiv_g / flour_g
+    cdef double yeast_factor = pow(baseline_ratio / ratio, yeast_exponent)
+    cdef double temp_factor = pow(q10, (baseline_temp_c - room_temp_c) / 10.0)
+    if not (isfinite(yeast_factor) and isfinite(temp_factor)):
+        return _bulk_hours_py(flour_g, dry_yeast_equiv_g, room_temp_c, baseline_ratio,
+                              baseline_time_h, baseline_temp_c, yeast_exponent, q10)
+    cdef double est_h = baseline_time_h * yeast_factor * temp_factor
+    if not est_h >= 0.15:   # >= ~9 minutes (NaN lands here too)
+        return 0.15
+    if est_h > 72.0:   # <= 3 days
+        return 72.0
+    return est_h
+
+
+cpdef double dry_equiv_g(
+    double flour_g,
+    double desired_time_h,
+    double room_temp_c,
+    double baseline_ratio,
+    double baseline_time_h,
+    double baseline_temp_c,
+    double yeast_exponent,
+    double q10,
+):
+    cdef double temp_factor = pow(q10, (baseline_temp_c - room_temp_c) / 10.0)
+    if not isfinite(temp_factor):   # checked before the division, which could raise first
+        return _dry_equiv_py(flour_g, desired_time_h, room_temp_c, baseline_ratio,
+                             baseline_time_h, baseline_temp_c, yeast_exponent, q10)
+    cdef double factor = pow(baseline_time_h * temp_factor / desired_time_h, 1.0 / yeast_exponent)
+    if not isfinite(factor):
+        return _dry_equiv_py(flour_g, desired_time_h, room_temp_c, baseline_ratio,
+                             baseline_time_h, baseline_temp_c, yeast_exponent, q10)
+    return baseline_ratio * factor * flour_g
@@ -40,6 +40,11 @@ Inversion (to solve for needed yeast):
   ratio = baseline_ratio * (baseline_time * temp_factor / desired_time)^(1/yeast_exponent)
   yeast_dry_equiv_g = ratio * flour_g
 
+The NumPy batch function evaluates the forward model in log-space (one log() + one exp()
+per row instead of two pow()); the scalar functions keep the pow() form above:
+  log(time)  = log(baseline_time) + yeast_exponent*log(baseline_ratio / ratio)
+               + (baseline_temp - room_temp) * log(q10)/10
+
 Fresh yeast conversion:
   dry_equiv_g = fresh_g * 0.33     (fresh ≈ 3× dry by weight)
   fresh_g     = dry_equiv_g / 0.33
@@ -47,25 +52,183 @@ Fresh yeast conversion:
 
 from __future__ import annotations
 
-import argparse
+import math
 import re
-from dataclasses import dataclass
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import argparse
 
+    import numpy as np
+    from numpy.typing import ArrayLike
 
-@dataclass(frozen=True)
-class RiseEstimate:
+
+class RiseEstimate(NamedTuple):
     hours: float
     low_hours: float
     high_hours: float
     warnings: tuple[str, ...]
 
 
-@dataclass(frozen=True)
-class YeastNeeded:
+class YeastNeeded(NamedTuple):
     dry_equiv_g: float
     yeast_g: float
     yeast_type: str
     warnings: tuple[str, ...]
+    predicted_bulk_h: float
+
+
+class StageTimes(NamedTuple):
+    bulk: float
+    final: float
+    total: float
+
+
+_RE_NUM = re.compile(r"\d+(?:\.\d+)?")
+_RE_MIN = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(?:m|min|mins|minute|minutes)\s*")
+_RE_HR = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(?:h|hr|hrs|hour|hours)\s*")
+
+
+# Warning texts, indexed by bit position in the warning masks below.
+_RISE_WARN_MSGS: tuple[str, ...] = (
+    "Room temperature looks unusual; results may be unreliable.",
+    "Cold environment: yeast activity will be very slow.",
+    "Very warm environment: dough may overproof quickly; watch closely.",
+    "Caution: very warm conditions can stress or kill yeast in real dough.",
+)
+_YEAST_WARN_MSGS: tuple[str, ...] = (
+    "Room temperature looks unusual; results may be unreliable.",
+    "Cold environment: required yeast may be high; consider a warmer spot.",
+    "Very warm environment: required yeast may be very low; watch closely.",
+    "Computed yeast is extremely small; measurement error will dominate (use a scale).",
+    "Computed yeast is very high; dough may taste yeasty and rise too fast/unevenly.",
+    "Very short rise targets are hard to control; consider increasing temperature instead.",
+)
+
+
+def _temp_warning_mask(room_temp_c: float) -> int:
+    """
+    Bits 0-3: unusual (<-10 or >50), cold (<10), very warm (>32), hot (>=40).
+    """
+    return (
+        (room_temp_c < -10 or room_temp_c > 50)
+        | (room_temp_c < 10) << 1
+        | (room_temp_c > 32) << 2
+        | (room_temp_c >= 40) << 3
+    )
+
+
+def _warnings_from_mask(mask: int, messages: tuple[str, ...]) -> tuple[str, ...]:
+    if not mask:
+        return ()
+    return tuple(msg for i, msg in enumerate(messages) if mask & (1 << i))
+
+
+def rise_warnings_from_mask(mask: int) -> tuple[str, ...]:
+    """
+    Decode one entry of the "warning_mask" array returned by estimate_rise_time_hours_batch().
+    """
+    return _warnings_from_mask(int(mask), _RISE_WARN_MSGS)
+
+
+# Yeast-type conversion factors for the default fresh->dry factor (0.33).
+_TO_DRY_FACTOR = {"dry": 1.0, "fresh": 0.33}
+_FROM_DRY_FACTOR = {"dry": 1.0, "fresh": 1.0 / 0.33}
+
+
+def _normalize_yeast_type(yeast_type: str) -> str:
+    yt = yeast_type.strip().lower()
+    if yt not in _TO_DRY_FACTOR:
+        raise ValueError("yeast_type must be 'dry' or 'fresh'.")
+    return yt
+
+
+def _bulk_hours_kernel(
+    flour_g: float,
+    dry_yeast_equiv_g: float,
+    room_temp_c: float,
+    baseline_ratio: float,
+    baseline_time_h: float,
+    baseline_temp_c: float,
+    yeast_exponent: float,
+    q10: float,
+) -> float:
+    """
+    Pure arithmetic core of the bulk model (inputs already validated), clipped to 0.15-72 h.
+    """
+    ratio = dry_yeast_equiv_g / flour_g
+    yeast_factor = (baseline_ratio / ratio) ** yeast_exponent
+    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
+    est_h = baseline_time_h * yeast_factor * temp_factor
+    return min(72.0, max(0.15, est_h))   # >= ~9 minutes, <= 3 days
+
+
+def _dry_equiv_kernel(
+    flour_g: float,
+    desired_time_h: float,
+    room_temp_c: float,
+    baseline_ratio: float,
+    baseline_time_h: float,
+    baseline_temp_c: float,
+    yeast_exponent: float,
+    q10: float,
+) -> float:
+    """
+    Pure arithmetic core of the inverse model: dry-equivalent yeast (g) for a bulk time.
+    """
+    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
+    ratio = baseline_ratio * (baseline_time_h * temp_factor / desired_time_h) ** (1.0 / yeast_exponent)
+    return ratio * flour_g
+
+
+# Optional AOT-compiled drop-in for the two kernels above (build: cythonize -i _rise_kernel.pyx).
+try:
+    from _rise_kernel import bulk_hours as _bulk_hours_fast, dry_equiv_g as _dry_equiv_fast
+except ImportError:
+    _bulk_hours_fast = _bulk_hours_kernel
+    _dry_equiv_fast = _dry_equiv_kernel
+
+
+# Array-API loop. _array_impl() swaps in numba-compiled versions of these names on first use,
+# so importing the module (and the scalar/CLI path) never loads numba.
+_bulk_hours_kernel_jit = _bulk_hours_kernel
+_prange = range
+_bulk_hours_array_impl = None
+
+
+def _bulk_hours_array(
+    flour: np.ndarray,
+    yeast: np.ndarray,
+    temp: np.ndarray,
+    out: np.ndarray,
+    baseline_ratio: float,
+    baseline_time_h: float,
+    baseline_temp_c: float,
+    yeast_exponent: float,
+    q10: float,
+) -> None:
+    for i in _prange(len(out)):
+        out[i] = _bulk_hours_kernel_jit(
+            flour[i], yeast[i], temp[i], baseline_ratio, baseline_time_h, baseline_temp_c, yeast_exponent, q10
+        )
+
+
+def _array_impl():
+    """
+    Return the array loop, JIT-compiling it with numba (if installed) on the first call.
+    """
+    global _bulk_hours_array_impl, _bulk_hours_kernel_jit, _prange
+    if _bulk_hours_array_impl is None:
+        try:
+            import numba
+        except ImportError:  # numba is optional: the loop then runs as plain Python
+            _bulk_hours_array_impl = _bulk_hours_array
+        else:
+            _bulk_hours_kernel_jit = numba.njit(cache=True, fastmath=True)(_bulk_hours_kernel)
+            _prange = numba.prange
+            _bulk_hours_array_impl = numba.njit(cache=True, fastmath=True, parallel=True)(_bulk_hours_array)
+    return _bulk_hours_array_impl
 
 
 def parse_duration_to_hours(value: str) -> float:
@@ -78,20 +241,20 @@ def parse_duration_to_hours(value: str) -> float:
     s = value.strip().lower()
     s = s.replace(",", ".")
 
-    if re.fullmatch(r"\d+(\.\d+)?", s):
+    if _RE_NUM.fullmatch(s):
         h = float(s)
         if h <= 0:
             raise ValueError("time must be > 0")
         return h
 
-    m = re.fullmatch(r"\s*(\d+(\.\d+)?)\s*(m|min|mins|minute|minutes)\s*", s)
+    m = _RE_MIN.fullmatch(s)
     if m:
         minutes = float(m.group(1))
         if minutes <= 0:
             raise ValueError("time must be > 0")
         return minutes / 60.0
 
-    h = re.fullmatch(r"\s*(\d+(\.\d+)?)\s*(h|hr|hrs|hour|hours)\s*", s)
+    h = _RE_HR.fullmatch(s)
     if h:
         hours = float(h.group(1))
         if hours <= 0:
@@ -112,13 +275,11 @@ def to_dry_equivalent_grams(
     if yeast_g <= 0:
         raise ValueError("yeast must be > 0 (tool is only for yeast dough).")
 
-    yt = yeast_type.strip().lower()
-    if yt == "dry":
-        return yeast_g
-    if yt == "fresh":
-        return yeast_g * fresh_to_dry_factor
-
-    raise ValueError("yeast_type must be 'dry' or 'fresh'.")
+    factor = _TO_DRY_FACTOR.get(yeast_type)
+    if factor is None or (factor != 1.0 and fresh_to_dry_factor != 0.33):
+        # Slow path: non-canonical spelling ("Fresh ") or a custom fresh factor
+        factor = 1.0 if _normalize_yeast_type(yeast_type) == "dry" else fresh_to_dry_factor
+    return yeast_g * factor
 
 
 def from_dry_equivalent_grams(
@@ -130,13 +291,11 @@ def from_dry_equivalent_grams(
     if dry_equiv_g <= 0:
         raise ValueError("dry_equiv_g must be > 0")
 
-    yt = yeast_type.strip().lower()
-    if yt == "dry":
-        return dry_equiv_g
-    if yt == "fresh":
-        return dry_equiv_g / fresh_to_dry_factor
-
-    raise ValueError("yeast_type must be 'dry' or 'fresh'.")
+    factor = _FROM_DRY_FACTOR.get(yeast_type)
+    if factor is None or (factor != 1.0 and fresh_to_dry_factor != 0.33):
+        # Slow path: non-canonical spelling ("Fresh ") or a custom fresh factor
+        factor = 1.0 if _normalize_yeast_type(yeast_type) == "dry" else 1.0 / fresh_to_dry_factor
+    return dry_equiv_g * factor
 
 
 def estimate_rise_time_hours(
@@ -154,37 +313,140 @@ def estimate_rise_time_hours(
     """
     Estimate BULK fermentation time in hours (first rise).
     """
-    warnings: list[str] = []
-
     if flour_g <= 0:
         raise ValueError("flour_g must be > 0")
     if dry_yeast_equiv_g <= 0:
         raise ValueError("dry_yeast_equiv_g must be > 0")
-    if room_temp_c < -10 or room_temp_c > 50:
-        warnings.append("Room temperature looks unusual; results may be unreliable.")
 
-    if room_temp_c < 10:
-        warnings.append("Cold environment: yeast activity will be very slow.")
-    if room_temp_c > 32:
-        warnings.append("Very warm environment: dough may overproof quickly; watch closely.")
-    if room_temp_c >= 40:
-        warnings.append("Caution: very warm conditions can stress or kill yeast in real dough.")
+    est_h = _bulk_hours_fast(
+        flour_g,
+        dry_yeast_equiv_g,
+        room_temp_c,
+        baseline_yeast_g / baseline_flour_g,
+        baseline_time_h,
+        baseline_temp_c,
+        yeast_exponent,
+        q10,
+    )
+
+    low = est_h * 0.75
+    high = est_h * 1.35
+
+    warnings = _warnings_from_mask(_temp_warning_mask(room_temp_c), _RISE_WARN_MSGS)
+
+    return RiseEstimate(hours=est_h, low_hours=low, high_hours=high, warnings=warnings)
+
+
+def estimate_rise_time_hours_batch(
+    flour_g: ArrayLike,
+    dry_yeast_g: ArrayLike,
+    room_temp_c: ArrayLike,
+    *,
+    baseline_flour_g: float = 500.0,
+    baseline_yeast_g: float = 7.0,
+    baseline_time_h: float = 1.0,
+    baseline_temp_c: float = 25.0,
+    yeast_exponent: float = 0.90,
+    q10: float = 2.0,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized BULK fermentation estimate for many recipes at once (sweeps, Monte-Carlo).
+
+    Inputs are array-likes (broadcast against each other); returns a dict of arrays:
+      {"hours": ..., "low_hours": ..., "high_hours": ..., "warning_mask": ...}
+
+    Same model and clipping as estimate_rise_time_hours(). Warnings are not built per row;
+    "warning_mask" is a uint8 array (0 = no warnings), decode with rise_warnings_from_mask().
+    Requires NumPy (imported lazily so the CLI does not depend on it).
+    """
+    import numpy as np
+
+    flour, yeast, temp = np.broadcast_arrays(
+        np.asarray(flour_g, dtype=np.float64),
+        np.asarray(dry_yeast_g, dtype=np.float64),
+        np.asarray(room_temp_c, dtype=np.float64),
+    )
+
+    if np.any(flour <= 0):
+        raise ValueError("flour_g must be > 0")
+    if np.any(yeast <= 0):
+        raise ValueError("dry_yeast_equiv_g must be > 0")
 
     baseline_ratio = baseline_yeast_g / baseline_flour_g
-    ratio = dry_yeast_equiv_g / flour_g
 
-    yeast_factor = (baseline_ratio / ratio) ** yeast_exponent
-    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
+    # Log-space: one np.log + one np.exp per row is cheaper than two array ** calls.
+    log_est = (
+        math.log(baseline_time_h)
+        + yeast_exponent * np.log(baseline_ratio / (yeast / flour))
+        + (baseline_temp_c - temp) * (math.log(q10) / 10.0)
+    )
+    est_h = np.clip(np.exp(log_est), 0.15, 72.0)
 
-    est_h = baseline_time_h * yeast_factor * temp_factor
+    mask = ((temp < -10) | (temp > 50)).astype(np.uint8)
+    mask |= (temp < 10).astype(np.uint8) << 1
+    mask |= (temp > 32).astype(np.uint8) << 2
+    mask |= (temp >= 40).astype(np.uint8) << 3
 
-    est_h = max(0.15, est_h)   # >= ~9 minutes
-    est_h = min(72.0, est_h)   # <= 3 days
+    return {"hours": est_h, "low_hours": est_h * 0.75, "high_hours": est_h * 1.35, "warning_mask": mask}
+
+
+def estimate_rise_time_array(
+    flour_g: ArrayLike,
+    dry_yeast_g: ArrayLike,
+    room_temp_c: ArrayLike,
+    *,
+    baseline_flour_g: float = 500.0,
+    baseline_yeast_g: float = 7.0,
+    baseline_time_h: float = 1.0,
+    baseline_temp_c: float = 25.0,
+    yeast_exponent: float = 0.90,
+    q10: float = 2.0,
+) -> np.ndarray:
+    """
+    BULK fermentation hours for many recipes, computed by a per-row loop over the model kernel.
+
+    If numba is installed it is imported and the loop JIT-compiled on the first call (parallel
+    over cores, cached on disk); call warmup() once up front so the compile cost is not paid inside a timed section.
+    Without numba the same loop runs as plain Python (prefer estimate_rise_time_hours_batch then).
+    Requires NumPy.
+    """
+    import numpy as np
+
+    flour, yeast, temp = np.broadcast_arrays(
+        np.asarray(flour_g, dtype=np.float64),
+        np.asarray(dry_yeast_g, dtype=np.float64),
+        np.asarray(room_temp_c, dtype=np.float64),
+    )
+    shape = flour.shape
+    flour = np.ascontiguousarray(flour).ravel()
+    yeast = np.ascontiguousarray(yeast).ravel()
+    temp = np.ascontiguousarray(temp).ravel()
+
+    if np.any(flour <= 0):
+        raise ValueError("flour_g must be > 0")
+    if np.any(yeast <= 0):
+        raise ValueError("dry_yeast_equiv_g must be > 0")
+
+    out = np.empty_like(flour)
+    _array_impl()(
+        flour,
+        yeast,
+        temp,
+        out,
+        baseline_yeast_g / baseline_flour_g,
+        baseline_time_h,
+        baseline_temp_c,
+        yeast_exponent,
+        q10,
+    )
+    return out.reshape(shape)
 
-    low = est_h * 0.75
-    high = est_h * 1.35
 
-    return RiseEstimate(hours=est_h, low_hours=low, high_hours=high, warnings=tuple(warnings))
+def warmup() -> None:
+    """
+    Trigger numba compilation of the array kernel (no-op cost without numba). Requires NumPy.
+    """
+    estimate_rise_time_array([500.0], [7.0], [25.0])
 
 
 def required_yeast_for_time(
@@ -205,52 +467,67 @@ def required_yeast_for_time(
     Compute required yeast for a desired BULK fermentation duration.
     (If you request stage=total or stage=final in the CLI, we convert that to bulk internally.)
     """
-    warnings: list[str] = []
-
     if flour_g <= 0:
         raise ValueError("flour_g must be > 0")
     if desired_time_h <= 0:
         raise ValueError("desired_time_h must be > 0")
-    if room_temp_c < -10 or room_temp_c > 50:
-        warnings.append("Room temperature looks unusual; results may be unreliable.")
-
-    if room_temp_c < 10:
-        warnings.append("Cold environment: required yeast may be high; consider a warmer spot.")
-    if room_temp_c > 32:
-        warnings.append("Very warm environment: required yeast may be very low; watch closely.")
 
     baseline_ratio = baseline_yeast_g / baseline_flour_g
-    temp_factor = q10 ** ((baseline_temp_c - room_temp_c) / 10.0)
-
-    ratio = baseline_ratio * (baseline_time_h * temp_factor / desired_time_h) ** (1.0 / yeast_exponent)
-    dry_equiv_g = ratio * flour_g
+    dry_equiv_g = _dry_equiv_fast(
+        flour_g,
+        desired_time_h,
+        room_temp_c,
+        baseline_ratio,
+        baseline_time_h,
+        baseline_temp_c,
+        yeast_exponent,
+        q10,
+    )
 
-    if dry_equiv_g < 0.1:
-        warnings.append("Computed yeast is extremely small; measurement error will dominate (use a scale).")
-    if dry_equiv_g > 30:
-        warnings.append("Computed yeast is very high; dough may taste yeasty and rise too fast/unevenly.")
-    if desired_time_h < 0.5:
-        warnings.append("Very short rise targets are hard to control; consider increasing temperature instead.")
+    # Temperature bits 0-2 (the hot-yeast bit 3 is not reported here), then result bits 3-5.
+    mask = (
+        (_temp_warning_mask(room_temp_c) & 0b111)
+        | (dry_equiv_g < 0.1) << 3
+        | (dry_equiv_g > 30) << 4
+        | (desired_time_h < 0.5) << 5
+    )
 
     yeast_g = from_dry_equivalent_grams(dry_equiv_g, yeast_type, fresh_to_dry_factor=fresh_to_dry_factor)
 
+    # Forward kernel on the computed yeast (inputs are already validated). Mathematically this is
+    # desired_time_h clipped to 0.15-72 h, but the float round-trip can differ in the last bits.
+    if dry_equiv_g > 0:
+        predicted_bulk_h = _bulk_hours_fast(
+            flour_g,
+            dry_equiv_g,
+            room_temp_c,
+            baseline_ratio,
+            baseline_time_h,
+            baseline_temp_c,
+            yeast_exponent,
+            q10,
+        )
+    else:  # yeast underflowed to 0 g: the model's time tends to infinity
+        predicted_bulk_h = 72.0
+
     return YeastNeeded(
         dry_equiv_g=dry_equiv_g,
         yeast_g=yeast_g,
         yeast_type=yeast_type,
-        warnings=tuple(warnings),
+        warnings=_warnings_from_mask(mask, _YEAST_WARN_MSGS),
+        predicted_bulk_h=predicted_bulk_h,
     )
 
 
-def stage_times_from_bulk(bulk_h: float, final_factor: float) -> dict[str, float]:
+def stage_times_from_bulk(bulk_h: float, final_factor: float) -> StageTimes:
     """
-    Return a dict of stage durations (hours) derived from bulk time.
+    Return the stage durations (hours) derived from bulk time.
     final = bulk * final_factor
     total = bulk + final
     """
     final_h = bulk_h * final_factor
     total_h = bulk_h + final_h
-    return {"bulk": bulk_h, "final": final_h, "total": total_h}
+    return StageTimes(bulk=bulk_h, final=final_h, total=total_h)
 
 
 def bulk_from_stage_time(stage: str, stage_time_h: float, final_factor: float) -> float:
@@ -290,6 +567,8 @@ def _fmt_hours(h: float) -> str:
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    import argparse  # CLI-only; keeps library imports light
+
     desc = """\
 Estimate yeast-dough rise time OR calculate required yeast.
 
@@ -372,6 +651,9 @@ def main() -> None:
 
     args = p.parse_args()
 
+    # Collected and written once at the end (one write instead of a print per line)
+    lines: list[str] = []
+
     model = {
         "baseline_flour_g": 500.0,
         "baseline_yeast_g": 7.0,
@@ -392,41 +674,41 @@ def main() -> None:
 
         # Input reporting
         if args.yeast_type == "fresh":
-            print(f"Yeast input:        {args.yeast:.2f} g fresh  (~{dry_equiv:.2f} g dry-equivalent)")
+            lines.append(f"Yeast input:        {args.yeast:.2f} g fresh  (~{dry_equiv:.2f} g dry-equivalent)")
         else:
-            print(f"Yeast input:        {args.yeast:.2f} g dry")
+            lines.append(f"Yeast input:        {args.yeast:.2f} g dry")
 
         # Output by stage selection
         if args.stage == "all":
-            print(f"Bulk (first rise):  {_fmt_hours(times['bulk'])}")
-            print(f"Final proof:        {_fmt_hours(times['final'])}  (final = bulk*{args.final_factor:.2f})")
-            print(f"Total:              {_fmt_hours(times['total'])}")
+            lines.append(f"Bulk (first rise):  {_fmt_hours(times.bulk)}")
+            lines.append(f"Final proof:        {_fmt_hours(times.final)}  (final = bulk*{args.final_factor:.2f})")
+            lines.append(f"Total:              {_fmt_hours(times.total)}")
         else:
             label = {
                 "bulk": "Bulk (first rise)",
                 "final": "Final proof",
                 "total": "Total",
             }[args.stage]
-            print(f"{label}: { _fmt_hours(times[args.stage]) }")
+            lines.append(f"{label}: { _fmt_hours(getattr(times, args.stage)) }")
 
         # Range (bulk-based; propagate factor for final/total)
         low_times = stage_times_from_bulk(bulk_est.low_hours, args.final_factor)
         high_times = stage_times_from_bulk(bulk_est.high_hours, args.final_factor)
 
         if args.stage == "all":
-            print("\nLikely ranges:")
-            print(f"  Bulk:  {_fmt_hours(low_times['bulk'])} – {_fmt_hours(high_times['bulk'])}")
-            print(f"  Final: {_fmt_hours(low_times['final'])} – {_fmt_hours(high_times['final'])}")
-            print(f"  Total: {_fmt_hours(low_times['total'])} – {_fmt_hours(high_times['total'])}")
+            lines.append("\nLikely ranges:")
+            lines.append(f"  Bulk:  {_fmt_hours(low_times.bulk)} – {_fmt_hours(high_times.bulk)}")
+            lines.append(f"  Final: {_fmt_hours(low_times.final)} – {_fmt_hours(high_times.final)}")
+            lines.append(f"  Total: {_fmt_hours(low_times.total)} – {_fmt_hours(high_times.total)}")
         else:
-            print(
-                f"Likely range:       {_fmt_hours(low_times[args.stage])} – {_fmt_hours(high_times[args.stage])}"
-            )
+            low_h = getattr(low_times, args.stage)
+            high_h = getattr(high_times, args.stage)
+            lines.append(f"Likely range:       {_fmt_hours(low_h)} – {_fmt_hours(high_h)}")
 
         if bulk_est.warnings:
-            print("\nNotes:")
+            lines.append("\nNotes:")
             for w in bulk_est.warnings:
-                print(f" - {w}")
+                lines.append(f" - {w}")
 
     else:
         stage_time_h = parse_duration_to_hours(args.time)
@@ -448,37 +730,37 @@ def main() -> None:
         else:
             stage_label = args.stage
 
-        print(f"Target {stage_label} time:  {_fmt_hours(stage_time_h)}")
+        lines.append(f"Target {stage_label} time:  {_fmt_hours(stage_time_h)}")
         if stage_label != "bulk":
-            print(f"(Converted to bulk: {_fmt_hours(bulk_target_h)} using final_factor={args.final_factor:.2f})")
+            lines.append(f"(Converted to bulk: {_fmt_hours(bulk_target_h)} using final_factor={args.final_factor:.2f})")
 
         if args.yeast_type == "fresh":
-            print(f"Required yeast:     {needed.yeast_g:.2f} g fresh  (~{needed.dry_equiv_g:.2f} g dry-equivalent)")
+            lines.append(f"Required yeast:     {needed.yeast_g:.2f} g fresh  (~{needed.dry_equiv_g:.2f} g dry-equivalent)")
         else:
-            print(f"Required yeast:     {needed.yeast_g:.2f} g dry")
+            lines.append(f"Required yeast:     {needed.yeast_g:.2f} g dry")
 
         if needed.warnings:
-            print("\nNotes:")
+            lines.append("\nNotes:")
             for w in needed.warnings:
-                print(f" - {w}")
+                lines.append(f" - {w}")
 
-        # Sanity check: compute bulk estimate from computed yeast, then present in requested stage terms
-        check_bulk = estimate_rise_time_hours(args.flour, needed.dry_equiv_g, args.temp)
-        check_times = stage_times_from_bulk(check_bulk.hours, args.final_factor)
+        # Sanity check: predicted bulk time for the computed yeast, presented in requested stage terms
+        check_times = stage_times_from_bulk(needed.predicted_bulk_h, args.final_factor)
         if args.stage == "all":
-            print("\nSanity check (predicted stages):")
-            print(f"  Bulk:  {_fmt_hours(check_times['bulk'])}")
-            print(f"  Final: {_fmt_hours(check_times['final'])}")
-            print(f"  Total: {_fmt_hours(check_times['total'])}")
+            lines.append("\nSanity check (predicted stages):")
+            lines.append(f"  Bulk:  {_fmt_hours(check_times.bulk)}")
+            lines.append(f"  Final: {_fmt_hours(check_times.final)}")
+            lines.append(f"  Total: {_fmt_hours(check_times.total)}")
         else:
-            print(f"\nSanity check (predicted): {_fmt_hours(check_times[stage_label])}")
+            lines.append(f"\nSanity check (predicted): {_fmt_hours(getattr(check_times, stage_label))}")
 
     if args.show_model:
-        print("\nModel settings:")
+        lines.append("\nModel settings:")
         for k, v in model.items():
-            print(f" - {k}: {v}")
+            lines.append(f" - {k}: {v}")
 
-    print("\nTip: Use this as a schedule guide—judge readiness by volume/feel, not the clock.")
+    lines.append("\nTip: Use this as a schedule guide—judge readiness by volume/feel, not the clock.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -15,14 +15,27 @@ Examples:
   python water_calc_mix.py --total-flour-g 800 --item wheat_1050:70% --item spelt_whole:30% --firmness soft
 """
 
+# PERFORMANCE NOTES:
+#   A run handles O(10) items and does a handful of float multiplies; there is no inner
+#   numeric loop. NumPy / Numba / SIMD / GPU approaches do not apply here and should not
+#   be proposed. The cost is interpreter overhead, so optimize dispatch count, not FLOPs:
+#     1. CLI parsing: hand-rolled argv scan (parse_args) instead of building an argparse parser.
+#     2. Tables built at import: _CANON_KEY (aliases + canonical names), _RANGE_STR, and
+#        _HYD_TABLES (one {flour: hydration} dict per firmness); normalize_flour_key is lru_cached.
+#     3. --item parsing with str.partition (no regex); MixItem is a slotted, frozen dataclass
+#        with precomputed water_g / range_str (frozen keeps water_g consistent with its inputs).
+#     4. One pass in build_mix() (firmness resolved only if an item lacks an override) and in
+#        write_summary(), which emits the whole table with a single write().
+
 from __future__ import annotations
 
-import argparse
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import functools
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, NoReturn, Optional, TextIO, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HydrationProfile:
     min_pct: float
     default_pct: float
@@ -57,36 +70,84 @@ ALIASES: Dict[str, str] = {
     "dinkelvollkorn": "spelt_whole", "dinkel_vollkorn": "spelt_whole", "dvk": "spelt_whole",
 }
 
+# Canonical names and aliases merged, so one dict probe resolves either form.
+_CANON_KEY: Dict[str, str] = {k: k for k in FLOUR_PROFILES}
+_CANON_KEY.update(ALIASES)
+
+_SORTED_FLOUR_KEYS: Tuple[str, ...] = tuple(sorted(FLOUR_PROFILES.keys()))
+_VALID_FLOURS_STR: str = ", ".join(_SORTED_FLOUR_KEYS)
+
+# "Range %" column text per flour; profiles are frozen, so render once.
+_RANGE_STR: Dict[str, str] = {k: f"{p.min_pct:.0f}-{p.max_pct:.0f}" for k, p in FLOUR_PROFILES.items()}
+
 
+@functools.lru_cache(maxsize=128)
 def normalize_flour_key(flour: str) -> str:
-    key = flour.strip().lower().replace(" ", "")
-    return ALIASES.get(key, key)
+    key = "".join(flour.split()).lower()  # drops all whitespace, Unicode included (e.g. NBSP)
+    return _CANON_KEY.get(key, key)
+
+
+# firmness -> index into (min_pct, default_pct, max_pct)
+_FIRMNESS_INDEX: Dict[str, int] = {
+    "tight": 0, "firm": 0, "stiff": 0,
+    "standard": 1, "default": 1, "normal": 1,
+    "soft": 2, "wet": 2,
+}
+
+
+def _firmness_index(firmness: str) -> int:
+    idx = _FIRMNESS_INDEX.get(firmness)  # the CLI already passes a canonical choice
+    if idx is None:
+        idx = _FIRMNESS_INDEX.get(firmness.strip().lower())
+        if idx is None:
+            raise ValueError("firmness must be one of: tight | standard | soft")
+    return idx
 
 
 def choose_hydration(profile: HydrationProfile, firmness: str) -> float:
-    f = firmness.strip().lower()
-    if f in ("tight", "firm", "stiff"):
-        return profile.min_pct
-    if f in ("soft", "wet"):
-        return profile.max_pct
-    if f in ("standard", "default", "normal"):
-        return profile.default_pct
-    raise ValueError("firmness must be one of: tight | standard | soft")
+    return (profile.min_pct, profile.default_pct, profile.max_pct)[_firmness_index(firmness)]
 
 
-@dataclass
+# firmness index -> {flour_key: hydration_pct}; profiles are frozen, so build all three once.
+_HYD_TABLES: Tuple[Dict[str, float], ...] = tuple(
+    {k: (p.min_pct, p.default_pct, p.max_pct)[idx] for k, p in FLOUR_PROFILES.items()} for idx in range(3)
+)
+
+
+def hydration_table(firmness: str) -> Dict[str, float]:
+    """
+    {flour_key: hydration_pct} for every known flour at this firmness (shared table; do not mutate).
+    """
+    return _HYD_TABLES[_firmness_index(firmness)]
+
+
+@dataclass(frozen=True, slots=True)
 class MixItem:
     flour_key: str
     flour_g: float
     hydration_pct: float
+    water_g: float  # flour_g * hydration_pct / 100; also ~ml (1 g water ≈ 1 ml)
+    range_str: str  # the flour's "min-max" hydration range, as shown in the summary
 
-    @property
-    def water_g(self) -> float:
-        return self.flour_g * (self.hydration_pct / 100.0)
 
-    @property
-    def water_ml(self) -> float:
-        return self.water_g  # 1 g water ≈ 1 ml
+_INVALID_ITEM = "Invalid --item '{}'. Use flour:grams[:hydration] or flour:percent%[:hydration]."
+
+
+def _pos_float(s: str, what: str, raw: str) -> float:
+    if "," in s:
+        frac = s.rpartition(",")[2].strip()
+        if len(frac) == 3 and frac.isdigit():  # "1,000": thousands separator or decimal comma?
+            raise ValueError(
+                f"Ambiguous number '{s.strip()}' in '{raw}'. Write decimals as 1,5 or 1.5 and no thousands separator."
+            )
+        s = s.replace(",", ".")
+    try:
+        v = float(s)
+    except ValueError:
+        raise ValueError(_INVALID_ITEM.format(raw)) from None
+    if not v > 0:  # also rejects nan
+        raise ValueError(f"{what} must be > 0 in '{raw}'.")
+    return v
 
 
 def parse_item(raw: str, total_flour_g: Optional[float]) -> Tuple[str, float, Optional[float], bool]:
@@ -96,88 +157,106 @@ def parse_item(raw: str, total_flour_g: Optional[float]) -> Tuple[str, float, Op
       flour:GRAMS:HYDRATION
       flour:PERCENT%
       flour:PERCENT%:HYDRATION
+    Numbers may use a decimal comma (e.g. 72,5), except before exactly three digits (1,000 is ambiguous).
     Returns (flour_key, amount, hydration_override, is_percent)
     """
-    parts = raw.split(":")
-    if len(parts) not in (2, 3):
-        raise ValueError(
-            f"Invalid --item '{raw}'. Use flour:grams[:hydration] or flour:percent%[:hydration]."
-        )
-
-    flour_key = normalize_flour_key(parts[0])
-    amount_str = parts[1].strip()
-    hydration_override = float(parts[2]) if len(parts) == 3 else None
+    flour, sep, rest = raw.partition(":")
+    amount_str, has_hyd, hyd_str = rest.partition(":")
+    if not sep or ":" in hyd_str:
+        raise ValueError(_INVALID_ITEM.format(raw))
 
+    amount_str = amount_str.strip()
     is_percent = amount_str.endswith("%")
     if is_percent:
         if total_flour_g is None:
             raise ValueError(f"--item '{raw}' uses %, but --total-flour-g is missing.")
-        pct = float(amount_str[:-1])
-        if pct <= 0:
-            raise ValueError(f"Percent must be > 0 in '{raw}'.")
-        amount = pct
-    else:
-        grams = float(amount_str)
-        if grams <= 0:
-            raise ValueError(f"Grams must be > 0 in '{raw}'.")
-        amount = grams
+        amount_str = amount_str[:-1]
+
+    flour_key = normalize_flour_key(flour)
+    amount = _pos_float(amount_str, "Percent" if is_percent else "Grams", raw)
+    hydration_override = _pos_float(hyd_str, "Hydration", raw) if has_hyd else None
 
     return flour_key, amount, hydration_override, is_percent
 
 
 def build_mix(items_raw: List[str], firmness: str, total_flour_g: Optional[float]) -> List[MixItem]:
-    parsed: List[Tuple[str, float, Optional[float], bool]] = []
+    hyd_table: Optional[Dict[str, float]] = None  # resolved on the first item without an override
+    mix: List[MixItem] = []
+    pct_sum = 0.0
+    saw_percent = saw_grams = False
     for raw in items_raw:
         flour_key, amount, hyd_override, is_percent = parse_item(raw, total_flour_g)
         if flour_key not in FLOUR_PROFILES:
-            valid = ", ".join(sorted(FLOUR_PROFILES.keys()))
-            raise ValueError(f"Unknown flour '{flour_key}' from '{raw}'. Valid: {valid}")
-        parsed.append((flour_key, amount, hyd_override, is_percent))
+            raise ValueError(f"Unknown flour '{flour_key}' from '{raw}'. Valid: {_VALID_FLOURS_STR}")
+
+        if is_percent:
+            assert total_flour_g is not None  # parse_item rejects % without it
+            saw_percent = True
+            pct_sum += amount
+            flour_g = total_flour_g * (amount / 100.0)
+        else:
+            saw_grams = True
+            flour_g = amount
+
+        if hyd_override is not None:
+            hyd = hyd_override
+        else:
+            if hyd_table is None:
+                hyd_table = hydration_table(firmness)
+            hyd = hyd_table[flour_key]
+        water_g = flour_g * (hyd / 100.0)
+        mix.append(
+            MixItem(
+                flour_key=flour_key,
+                flour_g=flour_g,
+                hydration_pct=hyd,
+                water_g=water_g,
+                range_str=_RANGE_STR[flour_key],
+            )
+        )
 
-    # If any percent items are present, all items should be percent-based and sum to 100%.
-    if any(is_percent for *_, is_percent in parsed):
-        assert total_flour_g is not None
-        if not all(is_percent for *_, is_percent in parsed):
-            raise ValueError("If you use % for one item, all --item entries must use %.")
-        pct_sum = sum(amount for _, amount, _, _ in parsed)
-        if abs(pct_sum - 100.0) > 1e-6:
-            raise ValueError(f"Percent items must sum to 100%, but sum to {pct_sum:.2f}%.")
+    if not saw_percent:
+        return mix  # all-grams mix (the common case): nothing left to validate
 
-    mix: List[MixItem] = []
-    for flour_key, amount, hyd_override, is_percent in parsed:
-        flour_g = (total_flour_g * (amount / 100.0)) if is_percent else amount
-        profile = FLOUR_PROFILES[flour_key]
-        hyd = hyd_override if hyd_override is not None else choose_hydration(profile, firmness)
-        mix.append(MixItem(flour_key=flour_key, flour_g=flour_g, hydration_pct=hyd))
+    # If any percent items are present, all items should be percent-based and sum to 100%.
+    if saw_grams:
+        raise ValueError("If you use % for one item, all --item entries must use %.")
+    if abs(pct_sum - 100.0) > 1e-6:
+        raise ValueError(f"Percent items must sum to 100%, but sum to {pct_sum:.2f}%.")
 
     return mix
 
 
-def summarize(mix: List[MixItem]) -> str:
-    total_flour = sum(i.flour_g for i in mix)
-    total_water = sum(i.water_g for i in mix)
+_SEP = "-" * 76
+_HEADER = f"{'Flour':<14} {'Flour g':>10} {'Hyd %':>8} {'Water g':>10} {'Water ml':>10}  {'Range %':>12}"
+_TABLE_HEAD = f"Mix breakdown (water shown as g and ~ml):\n{_SEP}\n{_HEADER}\n{_SEP}\n"
+_ROW_FMT = "%-14s %10.0f %8.1f %10.0f %10.0f  %12s\n"
+
+
+def write_summary(mix: List[MixItem], out: Optional[TextIO] = None) -> None:
+    """
+    Write the mix table to out (default: sys.stdout) with a single write() call.
+    """
+    if out is None:
+        out = sys.stdout
+
+    total_flour = total_water = 0.0
+    rows: List[str] = []
+    for i in mix:
+        total_flour += i.flour_g
+        total_water += i.water_g
+        rows.append(_ROW_FMT % (i.flour_key, i.flour_g, i.hydration_pct, i.water_g, i.water_g, i.range_str))
     weighted_hyd = (total_water / total_flour * 100.0) if total_flour > 0 else 0.0
     ta = weighted_hyd + 100.0
 
-    lines = []
-    lines.append("Mix breakdown (water shown as g and ~ml):")
-    lines.append("-" * 76)
-    lines.append(f"{'Flour':<14} {'Flour g':>10} {'Hyd %':>8} {'Water g':>10} {'Water ml':>10}  {'Range %':>12}")
-    lines.append("-" * 76)
-    for i in mix:
-        p = FLOUR_PROFILES[i.flour_key]
-        rng = f"{p.min_pct:.0f}-{p.max_pct:.0f}"
-        lines.append(
-            f"{i.flour_key:<14} {i.flour_g:>10.0f} {i.hydration_pct:>8.1f} {i.water_g:>10.0f} "
-            f"{i.water_ml:>10.0f}  {rng:>12}"
-        )
-    lines.append("-" * 76)
-    lines.append(
-        f"{'TOTAL':<14} {total_flour:>10.0f} {weighted_hyd:>8.1f} {total_water:>10.0f} {total_water:>10.0f}"
+    out.write(
+        _TABLE_HEAD
+        + "".join(rows)
+        + f"{_SEP}\n"
+        f"{'TOTAL':<14} {total_flour:>10.0f} {weighted_hyd:>8.1f} {total_water:>10.0f} {total_water:>10.0f}\n"
+        "\n"
+        f"Weighted hydration: {weighted_hyd:.1f}%  (TA {ta:.1f})\n"
     )
-    lines.append("")
-    lines.append(f"Weighted hydration: {weighted_hyd:.1f}%  (TA {ta:.1f})")
-    return "\n".join(lines)
 
 
 def print_examples() -> None:
@@ -190,13 +269,15 @@ def print_examples() -> None:
         "3) Percent mode (must sum to 100% + needs total flour grams):\n"
         "   python water_calc_mix.py --total-flour-g 800 --item wheat_1050:70% --item spelt_whole:30% --firmness soft\n\n"
         "4) Percent mode with per-item override:\n"
-        "   python water_calc_mix.py --total-flour-g 1000 --item wheat_550:60%:70 --item wheat_whole:40%:84\n"
+        "   python water_calc_mix.py --total-flour-g 1000 --item wheat_550:60%:70 --item wheat_whole:40%:84\n\n"
+        "5) Several items after one --item:\n"
+        "   python water_calc_mix.py --item wheat_550:350 spelt_1050:150\n"
     )
 
 
 def print_flours() -> None:
     print("\nSUPPORTED FLOURS\n")
-    for k in sorted(FLOUR_PROFILES.keys()):
+    for k in _SORTED_FLOUR_KEYS:
         p = FLOUR_PROFILES[k]
         print(f"- {k:12}  range {p.min_pct:.1f}–{p.max_pct:.1f}  default {p.default_pct:.1f}  ({p.note})")
 
@@ -213,69 +294,113 @@ def print_flours() -> None:
         print(f"- {s}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    description = (
-        "Calculate water for yeast dough with mixed flours.\n\n"
-        "Input modes:\n"
-        "  Grams mode:   --item flour:GRAMS[:HYDRATION]\n"
-        "  Percent mode: --total-flour-g N  AND  --item flour:PERCENT[:HYDRATION]\n"
-        "               (PERCENT items must sum to 100)\n\n"
-        "Hydration (water percent) is chosen per flour via --firmness unless you override it per item."
-    )
+_DESCRIPTION = """\
+Calculate water for yeast dough with mixed flours.
 
-    parser = argparse.ArgumentParser(
-        prog="water_calc_mix.py",
-        description=description,
-        formatter_class=argparse.RawTextHelpFormatter
-    )
+Input modes:
+  Grams mode:   --item flour:GRAMS[:HYDRATION]
+  Percent mode: --total-flour-g N  AND  --item flour:PERCENT[:HYDRATION]
+               (PERCENT items must sum to 100)
 
-    parser.add_argument(
-        "--item",
-        action="append",
-        help=(
-            "Repeatable ingredient entry.\n"
-            "Formats:\n"
-            "  flour:GRAMS[:HYDRATION]\n"
-            "  flour:PERCENT[:HYDRATION]   (use a trailing percent sign in actual input)\n"
-            "Examples (see --examples for copy/paste):\n"
-            "  --item wheat_550:350\n"
-            "  --item spelt_whole:30percent:78  (illustrative only; real examples are in --examples)"
-        ),
-    )
+Hydration (water percent) is chosen per flour via --firmness unless you override it per item."""
 
-    parser.add_argument(
-        "--firmness",
-        default="standard",
-        choices=["tight", "standard", "soft"],
-        help="Pick min/default/max hydration per flour (ignored when hydration override is provided)."
-    )
+_USAGE = """\
+usage: water_calc_mix.py [-h] [--item ITEM [ITEM ...]]
+                         [--firmness {tight,standard,soft}]
+                         [--total-flour-g TOTAL_FLOUR_G] [--examples]
+                         [--list-flours]
+"""
 
-    parser.add_argument(
-        "--total-flour-g",
-        type=float,
-        default=None,
-        help="Required if any --item uses percentages (e.g., 800)."
-    )
+_OPTIONS_HELP = """\
+options:
+  -h, --help            show this help message and exit
+  --item ITEM [ITEM ...]
+                        Ingredient entries: repeat the flag and/or list several items after it.
+                        Formats:
+                          flour:GRAMS[:HYDRATION]
+                          flour:PERCENT[:HYDRATION]   (use a trailing percent sign in actual input)
+                        Examples (see --examples for copy/paste):
+                          --item wheat_550:350
+                          --item spelt_whole:30percent:78  (illustrative only; real examples are in --examples)
+  --firmness {tight,standard,soft}
+                        Pick min/default/max hydration per flour (ignored when hydration override is provided).
+  --total-flour-g TOTAL_FLOUR_G
+                        Required if any --item uses percentages (e.g., 800).
+  --examples            Print usage examples and exit.
+  --list-flours         List supported flours and exit.
+"""
 
-    parser.add_argument(
-        "--examples",
-        action="store_true",
-        help="Print usage examples and exit."
-    )
+_FIRMNESS_CHOICES = ("tight", "standard", "soft")
 
-    parser.add_argument(
-        "--list-flours",
-        action="store_true",
-        help="List supported flours and exit."
-    )
 
-    return parser
+@dataclass
+class CliArgs:
+    item: List[str] = field(default_factory=list)
+    firmness: str = "standard"
+    total_flour_g: Optional[float] = None
+    examples: bool = False
+    list_flours: bool = False
+
+
+def _cli_error(message: str) -> NoReturn:
+    sys.stderr.write(f"{_USAGE}water_calc_mix.py: error: {message}\n")
+    raise SystemExit(2)
 
 
+def parse_args(argv: List[str]) -> CliArgs:
+    """
+    Minimal argv scanner for this fixed flag set (flags and error messages match the former argparse CLI).
+    Accepts both "--flag VALUE" and "--flag=VALUE".
+    """
+    args = CliArgs()
+    i, n = 0, len(argv)
+    while i < n:
+        arg = argv[i]
+        i += 1
+
+        if arg in ("-h", "--help"):
+            sys.stdout.write(f"{_USAGE}\n{_DESCRIPTION}\n\n{_OPTIONS_HELP}")
+            raise SystemExit(0)
+        if arg == "--examples":
+            args.examples = True
+            continue
+        if arg == "--list-flours":
+            args.list_flours = True
+            continue
+
+        name, eq, value = arg.partition("=")
+        if name not in ("--item", "--firmness", "--total-flour-g"):
+            _cli_error(f"unrecognized arguments: {arg}")
+        if not eq:
+            if i >= n or argv[i].startswith("--") or argv[i] == "-h":
+                what = "at least one argument" if name == "--item" else "one argument"
+                _cli_error(f"argument {name}: expected {what}")
+            value = argv[i]
+            i += 1
+
+        if name == "--item":
+            args.item.append(value)
+            if not eq:
+                # --item A B C: take every following value up to the next flag
+                while i < n and not argv[i].startswith("-"):
+                    args.item.append(argv[i])
+                    i += 1
+        elif name == "--firmness":
+            if value not in _FIRMNESS_CHOICES:
+                choices = ", ".join(f"'{c}'" for c in _FIRMNESS_CHOICES)
+                _cli_error(f"argument --firmness: invalid choice: '{value}' (choose from {choices})")
+            args.firmness = value
+        else:
+            try:
+                args.total_flour_g = float(value)
+            except ValueError:
+                _cli_error(f"argument --total-flour-g: invalid float value: '{value}'")
+
+    return args
+
 
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
 
     if args.examples:
         print_examples()
@@ -286,7 +411,7 @@ def main() -> None:
         return
 
     if not args.item:
-        parser.error("You must provide at least one --item. Use --examples to see how.")
+        _cli_error("You must provide at least one --item. Use --examples to see how.")
 
     if args.total_flour_g is not None and args.total_flour_g <= 0:
         raise SystemExit("--total-flour-g must be > 0")
@@ -296,7 +421,7 @@ def main() -> None:
     except ValueError as e:
         raise SystemExit(str(e))
 
-    print(summarize(mix))
+    write_summary(mix)
 
 
 if __name__ == "__main__":